@@ -229,6 +229,14 @@ def _canonicalize_modifiers(modifiers):
     will be present if total power is negative, whereas the power modifier will
     be present only with positive powers different from 1.
     """
+    if len(modifiers) == 1:
+        # A single inverse or control modifier is already canonical.
+        modifier = modifiers[0]
+        if isinstance(modifier, InverseModifier):
+            return [InverseModifier()]
+        if isinstance(modifier, ControlModifier) and modifier.num_ctrl_qubits > 0:
+            return [ControlModifier(modifier.num_ctrl_qubits, modifier.ctrl_state)]
+
     power = 1
     num_ctrl_qubits = 0
     ctrl_state = 0
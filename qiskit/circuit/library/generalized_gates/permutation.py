@@ -141,7 +141,9 @@ class PermutationGate(Gate):
             raise CircuitError(
                 "Permutation pattern must be some ordering of 0..num_qubits-1 in a list."
             )
-        pattern = np.array(pattern)
+        # The permutation synthesis routines in Rust read the pattern as an int64 array,
+        # so store it with that dtype to let them view it without a conversion copy.
+        pattern = np.array(pattern, dtype=np.int64)
 
         super().__init__(name="permutation", num_qubits=num_qubits, params=[pattern])
 
@@ -24,8 +24,7 @@ from qiskit.exceptions import QiskitError
 from qiskit.pulse import InstructionScheduleMap, Schedule
 from qiskit.providers.backend import Backend
 from qiskit.scheduler import ScheduleConfig
-from qiskit.scheduler.schedule_circuit import schedule_circuit
-from qiskit.utils.parallel import parallel_map
+from qiskit.scheduler.schedule_circuit import schedule_circuits
 
 logger = logging.getLogger(__name__)
 
@@ -98,7 +97,7 @@ def schedule(
 
     schedule_config = ScheduleConfig(inst_map=inst_map, meas_map=meas_map, dt=dt)
     circuits = circuits if isinstance(circuits, list) else [circuits]
-    schedules = parallel_map(schedule_circuit, circuits, (schedule_config, method, backend))
+    schedules = schedule_circuits(circuits, schedule_config, method, backend)
     end_time = time()
     _log_schedule_time(start_time, end_time)
     if arg_circuits_list:
@@ -77,6 +77,8 @@ class Channel(metaclass=ABCMeta):
     for the ``prefix`` class attribute.
     """
 
+    __slots__ = ("_index", "_hash")
+
     prefix: str | None = None
     """A shorthand string prefix for characterizing the channel type."""
 
@@ -98,6 +100,9 @@ class Channel(metaclass=ABCMeta):
         """
         self._validate_index(index)
         self._index = index
+        # Channels are immutable and used as dict keys in every timeslot lookup,
+        # so the hash is computed once here rather than on each call.
+        self._hash = hash((type(self), index))
 
     @property
     def index(self) -> int | ParameterExpression:
@@ -159,30 +164,46 @@ class Channel(metaclass=ABCMeta):
         return type(self) is type(other) and self._index == other._index
 
     def __hash__(self):
-        return hash((type(self), self._index))
+        return self._hash
+
+    def __getstate__(self):
+        # The cached hash depends on the process (the hash of the channel type, and of string
+        # parameter names), so only the index is pickled and the hash is rebuilt on load.
+        return (self._index,)
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # Channels pickled by earlier versions store their instance dictionary.
+            index = state["_index"]
+        else:
+            (index,) = state
+        self._index = index
+        self._hash = hash((type(self), index))
 
 
 class PulseChannel(Channel, metaclass=ABCMeta):
     """Base class of transmit Channels. Pulses can be played on these channels."""
 
-    pass
+    __slots__ = ()
 
 
 class ClassicalIOChannel(Channel, metaclass=ABCMeta):
     """Base class of classical IO channels. These cannot have instructions scheduled on them."""
 
-    pass
+    __slots__ = ()
 
 
 class DriveChannel(PulseChannel):
     """Drive channels transmit signals to qubits which enact gate operations."""
 
+    __slots__ = ()
     prefix = "d"
 
 
 class MeasureChannel(PulseChannel):
     """Measure channels transmit measurement stimulus pulses for readout."""
 
+    __slots__ = ()
     prefix = "m"
 
 
@@ -192,18 +213,21 @@ class ControlChannel(PulseChannel):
     to a particular qubit index.
     """
 
+    __slots__ = ()
     prefix = "u"
 
 
 class AcquireChannel(Channel):
     """Acquire channels are used to collect data."""
 
+    __slots__ = ()
     prefix = "a"
 
 
 class SnapshotChannel(ClassicalIOChannel):
     """Snapshot channels are used to specify instructions for simulators."""
 
+    __slots__ = ()
     prefix = "s"
 
     def __init__(self):
@@ -214,6 +238,7 @@ class SnapshotChannel(ClassicalIOChannel):
 class MemorySlot(ClassicalIOChannel):
     """Memory slot channels represent classical memory storage."""
 
+    __slots__ = ()
     prefix = "m"
 
 
@@ -222,4 +247,5 @@ class RegisterSlot(ClassicalIOChannel):
     memory).
     """
 
+    __slots__ = ()
     prefix = "c"
@@ -363,7 +363,7 @@ class Schedule:
 
         timeslots = {}
         for chan, ch_timeslots in self._timeslots.items():
-            timeslots[chan] = [(ts[0] + time, ts[1] + time) for ts in ch_timeslots]
+            timeslots[chan] = [(t0 + time, t1 + time) for t0, t1 in ch_timeslots]
 
         _check_nonnegative_timeslot(timeslots)
 
@@ -438,7 +438,7 @@ class Schedule:
             inplace: Perform operation inplace on this schedule. Otherwise
                 return a new ``Schedule``.
         """
-        common_channels = set(self.channels) & set(schedule.channels)
+        common_channels = self._timeslots.keys() & set(schedule.channels)
         time = self.ch_stop_time(*common_channels)
         return self.insert(time, schedule, name=name, inplace=inplace)
 
@@ -529,28 +529,32 @@ class Schedule:
         other_timeslots = _get_timeslots(schedule)
         self._duration = max(self._duration, time + schedule.duration)
 
-        for channel in schedule.channels:
-            if channel not in self._timeslots:
+        # The timeslots are keyed by the channels of ``schedule``, so iterate them directly
+        # rather than building the ``channels`` tuple.
+        for channel, other_ch_timeslots in other_timeslots.items():
+            ch_timeslots = self._timeslots.get(channel)
+            if ch_timeslots is None:
                 if time == 0:
-                    self._timeslots[channel] = copy.copy(other_timeslots[channel])
+                    self._timeslots[channel] = copy.copy(other_ch_timeslots)
                 else:
                     self._timeslots[channel] = [
-                        (i[0] + time, i[1] + time) for i in other_timeslots[channel]
+                        (t0 + time, t1 + time) for t0, t1 in other_ch_timeslots
                     ]
                 continue
 
-            for idx, interval in enumerate(other_timeslots[channel]):
-                if interval[0] + time >= self._timeslots[channel][-1][1]:
-                    # Can append the remaining intervals
-                    self._timeslots[channel].extend(
-                        [(i[0] + time, i[1] + time) for i in other_timeslots[channel][idx:]]
+            for idx, interval in enumerate(other_ch_timeslots):
+                if interval[0] + time >= ch_timeslots[-1][1]:
+                    # Can append the remaining intervals. Schedules built in time order, such
+                    # as those from the ASAP/ALAP schedulers, always take this path at idx 0.
+                    ch_timeslots.extend(
+                        [(t0 + time, t1 + time) for t0, t1 in other_ch_timeslots[idx:]]
                     )
                     break
 
                 try:
                     interval = (interval[0] + time, interval[1] + time)
-                    index = _find_insertion_index(self._timeslots[channel], interval)
-                    self._timeslots[channel].insert(index, interval)
+                    index = _find_insertion_index(ch_timeslots, interval)
+                    ch_timeslots.insert(index, interval)
                 except PulseError as ex:
                     raise PulseError(
                         f"Schedule(name='{schedule.name or ''}') cannot be inserted into "
@@ -559,7 +563,10 @@ class Schedule:
                         f"{interval[0]} to {interval[1]} overlaps with an existing instruction."
                     ) from ex
 
-        _check_nonnegative_timeslot(self._timeslots)
+        if time < 0:
+            # Existing timeslots are already nonnegative, so only a negative shift of the
+            # inserted schedule can introduce a negative start time.
+            _check_nonnegative_timeslot(self._timeslots)
 
     def _remove_timeslots(self, time: int, schedule: "ScheduleComponent"):
         """Delete the timeslots if present for the respective schedule component.
@@ -574,15 +581,15 @@ class Schedule:
         if not isinstance(time, int):
             raise PulseError("Schedule start time must be an integer.")
 
-        for channel in schedule.channels:
+        other_timeslots = _get_timeslots(schedule)
+        for channel, other_ch_timeslots in other_timeslots.items():
 
             if channel not in self._timeslots:
                 raise PulseError(f"The channel {channel} is not present in the schedule")
 
             channel_timeslots = self._timeslots[channel]
-            other_timeslots = _get_timeslots(schedule)
 
-            for interval in other_timeslots[channel]:
+            for interval in other_ch_timeslots:
                 if channel_timeslots:
                     interval = (interval[0] + time, interval[1] + time)
                     index = _interval_index(channel_timeslots, interval)
@@ -1734,27 +1741,28 @@ def _interval_index(intervals: list[Interval], interval: Interval) -> int:
     return index
 
 
-def _locate_interval_index(intervals: list[Interval], interval: Interval, index: int = 0) -> int:
+def _locate_interval_index(intervals: list[Interval], interval: Interval) -> int:
     """Using binary search on start times, find an interval.
 
     Args:
         intervals: A sorted list of non-overlapping Intervals.
         interval: The interval for which the index into intervals will be found.
-        index: A running tally of the index, for recursion. The user should not pass a value.
 
     Returns:
         The index into intervals that new_interval would be inserted to maintain
         a sorted list of intervals.
     """
-    if not intervals or len(intervals) == 1:
-        return index
-
-    mid_idx = len(intervals) // 2
-    mid = intervals[mid_idx]
-    if interval[1] <= mid[0] and (interval != mid):
-        return _locate_interval_index(intervals[:mid_idx], interval, index=index)
-    else:
-        return _locate_interval_index(intervals[mid_idx:], interval, index=index + mid_idx)
+    # Search over index bounds rather than list slices, so that locating an interval is
+    # logarithmic in the number of intervals instead of copying them.
+    low, high = 0, len(intervals)
+    while high - low > 1:
+        mid_idx = (low + high) // 2
+        mid = intervals[mid_idx]
+        if interval[1] <= mid[0] and (interval != mid):
+            high = mid_idx
+        else:
+            low = mid_idx
+    return low
 
 
 def _find_insertion_index(intervals: list[Interval], new_interval: Interval) -> int:
@@ -26,6 +26,7 @@ Core API
 
 .. currentmodule:: qiskit.scheduler.schedule_circuit
 .. autofunction:: schedule_circuit
+.. autofunction:: schedule_circuits
 .. currentmodule:: qiskit.scheduler
 
 Pulse scheduling methods
@@ -68,21 +68,32 @@ def lower_gates(
 
     inst_map = schedule_config.inst_map
     qubit_mem_slots = {}  # Map measured qubit index to classical bit index
+    # Map (gate name, qubits, params) to the lowered schedule, since circuits typically apply
+    # the same gates to the same qubits many times (e.g. randomized benchmarking sequences)
+    lowered_gates = {}
 
-    # convert the unit of durations from SI to dt before lowering
-    circuit = convert_durations_to_dt(circuit, dt_in_sec=schedule_config.dt, inplace=False)
+    # convert the unit of durations from SI to dt before lowering, only copying the circuit
+    # when it actually contains durations to convert
+    if any(
+        instruction.operation.duration is not None and instruction.operation.unit != "dt"
+        for instruction in circuit.data
+    ):
+        circuit = convert_durations_to_dt(circuit, dt_in_sec=schedule_config.dt, inplace=False)
+
+    # ``QuantumCircuit.calibrations`` returns a new dict on each access, so look it up only once
+    calibrations = circuit.calibrations
 
     def get_measure_schedule(qubit_mem_slots: Dict[int, int]) -> CircuitPulseDef:
         """Create a schedule to measure the qubits queued for measuring."""
         sched = Schedule()
         # Exclude acquisition on these qubits, since they are handled by the user calibrations
         acquire_excludes = {}
-        if Measure().name in circuit.calibrations.keys():
+        if Measure().name in calibrations.keys():
             qubits = tuple(sorted(qubit_mem_slots.keys()))
             params = ()
             for qubit in qubits:
                 try:
-                    meas_q = circuit.calibrations[Measure().name][((qubit,), params)]
+                    meas_q = calibrations[Measure().name][((qubit,), params)]
                     meas_q = target_qobj_transform(meas_q)
                     acquire_q = meas_q.filter(channels=[AcquireChannel(qubit)])
                     mem_slot_index = [
@@ -151,28 +162,53 @@ def lower_gates(
                 )
             qubit_mem_slots[inst_qubits[0]] = clbit_indices[instruction.clbits[0]]
         else:
+            gate_cals = calibrations.get(instruction.operation.name)
+            if gate_cals is not None:
+                try:
+                    schedule = gate_cals[
+                        (
+                            tuple(inst_qubits),
+                            tuple(
+                                p if getattr(p, "parameters", None) else float(p)
+                                for p in instruction.operation.params
+                            ),
+                        )
+                    ]
+                    schedule = target_qobj_transform(schedule)
+                    circ_pulse_defs.append(CircuitPulseDef(schedule=schedule, qubits=inst_qubits))
+                    continue
+                except KeyError:
+                    pass  # Calibration not defined for these qubits and parameters
+
             try:
-                gate_cals = circuit.calibrations[instruction.operation.name]
-                schedule = gate_cals[
-                    (
-                        tuple(inst_qubits),
-                        tuple(
-                            p if getattr(p, "parameters", None) else float(p)
-                            for p in instruction.operation.params
-                        ),
-                    )
-                ]
-                schedule = target_qobj_transform(schedule)
-                circ_pulse_defs.append(CircuitPulseDef(schedule=schedule, qubits=inst_qubits))
+                # Parameters which can't be converted to floats (e.g. unbound parameters)
+                # bypass the cache.
+                gate_key = (
+                    instruction.operation.name,
+                    tuple(inst_qubits),
+                    tuple(float(p) for p in instruction.operation.params),
+                )
+            except (TypeError, ValueError):
+                gate_key = None
+
+            schedule = lowered_gates.get(gate_key)
+            if schedule is not None:
+                # Each repeated gate gets its own (shallow) copy of the schedule, sharing only
+                # the instructions, so that modifying one lowered schedule in place does not
+                # change the others.
+                copied = Schedule.initialize_from(schedule)
+                for time, child in schedule.children:
+                    copied.insert(time, child, inplace=True)
+                circ_pulse_defs.append(CircuitPulseDef(schedule=copied, qubits=inst_qubits))
                 continue
-            except KeyError:
-                pass  # Calibration not defined for this operation
 
             try:
                 schedule = inst_map.get(
                     instruction.operation, inst_qubits, *instruction.operation.params
                 )
                 schedule = target_qobj_transform(schedule)
+                if gate_key is not None:
+                    lowered_gates[gate_key] = schedule
                 circ_pulse_defs.append(CircuitPulseDef(schedule=schedule, qubits=inst_qubits))
             except PulseError as ex:
                 raise QiskitError(
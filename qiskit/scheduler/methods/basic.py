@@ -13,15 +13,14 @@
 """
 The most straightforward scheduling methods: scheduling **as early** or **as late** as possible.
 """
-from collections import defaultdict
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.barrier import Barrier
 from qiskit.pulse.schedule import Schedule
 
 from qiskit.scheduler.config import ScheduleConfig
-from qiskit.scheduler.lowering import lower_gates
+from qiskit.scheduler.lowering import CircuitPulseDef, lower_gates
 from qiskit.providers import BackendV1, BackendV2
 
 
@@ -49,32 +48,15 @@ def as_soon_as_possible(
         A schedule corresponding to the input ``circuit`` with pulses occurring as early as
         possible.
     """
-    qubit_time_available = defaultdict(int)
-
-    def update_times(inst_qubits: List[int], time: int = 0) -> None:
-        """Update the time tracker for all inst_qubits to the given time."""
-        for q in inst_qubits:
-            qubit_time_available[q] = time
-
-    start_times = []
     circ_pulse_defs = lower_gates(circuit, schedule_config, backend)
-    for circ_pulse_def in circ_pulse_defs:
-        start_time = max(qubit_time_available[q] for q in circ_pulse_def.qubits)
-        stop_time = start_time
-        if not isinstance(circ_pulse_def.schedule, Barrier):
-            stop_time += circ_pulse_def.schedule.duration
-
-        start_times.append(start_time)
-        update_times(circ_pulse_def.qubits, stop_time)
+    start_times, _ = _pack_instructions(
+        [cpd.qubits for cpd in circ_pulse_defs], [_duration(cpd) for cpd in circ_pulse_defs]
+    )
 
-    timed_schedules = [
-        (time, cpd.schedule)
-        for time, cpd in zip(start_times, circ_pulse_defs)
-        if not isinstance(cpd.schedule, Barrier)
-    ]
     schedule = Schedule.initialize_from(circuit)
-    for time, inst in timed_schedules:
-        schedule.insert(time, inst, inplace=True)
+    for circ_pulse_def, start_time in zip(circ_pulse_defs, start_times):
+        if not isinstance(circ_pulse_def.schedule, Barrier):
+            schedule.insert(start_time, circ_pulse_def.schedule, inplace=True)
     return schedule
 
 
@@ -105,33 +87,61 @@ def as_late_as_possible(
         A schedule corresponding to the input ``circuit`` with pulses occurring as late as
         possible.
     """
-    qubit_time_available = defaultdict(int)
-
-    def update_times(inst_qubits: List[int], time: int = 0) -> None:
-        """Update the time tracker for all inst_qubits to the given time."""
-        for q in inst_qubits:
-            qubit_time_available[q] = time
-
-    rev_stop_times = []
     circ_pulse_defs = lower_gates(circuit, schedule_config, backend)
-    for circ_pulse_def in reversed(circ_pulse_defs):
-        start_time = max(qubit_time_available[q] for q in circ_pulse_def.qubits)
-        stop_time = start_time
+    durations = [_duration(cpd) for cpd in circ_pulse_defs]
+    rev_start_times, last_stop = _pack_instructions(
+        [cpd.qubits for cpd in reversed(circ_pulse_defs)], durations[::-1]
+    )
+
+    schedule = Schedule.initialize_from(circuit)
+    for circ_pulse_def, duration, rev_start_time in zip(
+        circ_pulse_defs, durations, reversed(rev_start_times)
+    ):
         if not isinstance(circ_pulse_def.schedule, Barrier):
-            stop_time += circ_pulse_def.schedule.duration
+            start_time = last_stop - rev_start_time - duration
+            schedule.insert(start_time, circ_pulse_def.schedule, inplace=True)
+    return schedule
 
-        rev_stop_times.append(stop_time)
-        update_times(circ_pulse_def.qubits, stop_time)
 
-    last_stop = max(t for t in qubit_time_available.values()) if qubit_time_available else 0
-    start_times = [last_stop - t for t in reversed(rev_stop_times)]
+def _duration(circ_pulse_def: CircuitPulseDef) -> int:
+    """Return the time a circuit pulse definition occupies its qubits for."""
+    if isinstance(circ_pulse_def.schedule, Barrier):
+        return 0
+    return circ_pulse_def.schedule.duration
 
-    timed_schedules = [
-        (time, cpd.schedule)
-        for time, cpd in zip(start_times, circ_pulse_defs)
-        if not isinstance(cpd.schedule, Barrier)
-    ]
-    schedule = Schedule.initialize_from(circuit)
-    for time, inst in timed_schedules:
-        schedule.insert(time, inst, inplace=True)
-    return schedule
+
+def _pack_instructions(qubits: List[List[int]], durations: List[int]) -> Tuple[List[int], int]:
+    """Place instructions in the given order at the earliest time at which all of their qubits
+    are available.
+
+    This only does integer bookkeeping, independent of the pulse schedules being placed, so that
+    both scheduling policies share it: ALAP is ASAP over the reversed instruction order.
+
+    The instructions must be given in a topological order of the circuit. The order of the
+    circuit's data, as returned by :func:`.lower_gates`, is one such order, so no DAG needs to be
+    built or sorted to schedule a circuit.
+
+    Args:
+        qubits: The qubit indices each instruction acts on.
+        durations: The duration of each instruction.
+
+    Returns:
+        The start time of each instruction, and the stop time of the last instruction.
+    """
+    # Qubit indices are small dense integers, so keep the availability times in a list indexed
+    # by qubit rather than hashing each index into a dict.
+    num_qubits = 1 + max((max(inst_qubits, default=-1) for inst_qubits in qubits), default=-1)
+    qubit_time_available = [0] * num_qubits
+    start_times = []
+    for inst_qubits, duration in zip(qubits, durations):
+        if len(inst_qubits) == 1:
+            # Single-qubit instructions dominate typical circuits; avoid the generator overhead.
+            (qubit,) = inst_qubits
+            start_time = qubit_time_available[qubit]
+            qubit_time_available[qubit] = start_time + duration
+        else:
+            start_time = max(qubit_time_available[q] for q in inst_qubits)
+            for q in inst_qubits:
+                qubit_time_available[q] = start_time + duration
+        start_times.append(start_time)
+    return start_times, max(qubit_time_available, default=0)
@@ -11,7 +11,7 @@
 # that they have been altered from the originals.
 
 """QuantumCircuit to Pulse scheduler."""
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.exceptions import QiskitError
@@ -20,6 +20,7 @@ from qiskit.pulse.schedule import Schedule
 from qiskit.scheduler.config import ScheduleConfig
 from qiskit.scheduler.methods import as_soon_as_possible, as_late_as_possible
 from qiskit.providers import BackendV1, BackendV2
+from qiskit.utils.parallel import parallel_map
 
 
 def schedule_circuit(
@@ -65,3 +66,34 @@ def schedule_circuit(
         return methods[method](circuit, schedule_config, backend)
     except KeyError as ex:
         raise QiskitError(f"Scheduling method {method} isn't recognized.") from ex
+
+
+def schedule_circuits(
+    circuits: List[QuantumCircuit],
+    schedule_config: ScheduleConfig,
+    method: Optional[str] = None,
+    backend: Optional[Union[BackendV1, BackendV2]] = None,
+) -> List[Schedule]:
+    """
+    Schedule a list of circuits to pulse Schedules, one per circuit.
+
+    Each circuit is scheduled independently with :func:`schedule_circuit`, so the circuits are
+    distributed over multiple processes with :func:`~qiskit.utils.parallel_map` when there is
+    more than one of them and the parallel configuration permits it (see ``QISKIT_PARALLEL`` and
+    ``QISKIT_NUM_PROCS``).
+
+    Args:
+        circuits: The quantum circuits to translate.
+        schedule_config: Backend specific parameters used for building the Schedules.
+        method: The scheduling pass method to use. See :func:`schedule_circuit` for the
+            supported methods.
+        backend: A backend used to build the Schedules, the backend could be BackendV1
+                 or BackendV2.
+
+    Returns:
+        A list of Schedules, in the same order as the input ``circuits``.
+
+    Raises:
+        QiskitError: If method isn't recognized.
+    """
+    return parallel_map(schedule_circuit, circuits, (schedule_config, method, backend))
@@ -80,15 +80,10 @@ def synth_clifford_greedy(clifford: Clifford) -> QuantumCircuit:
 
             pauli_z = Pauli("I" * (num_qubits - qubit - 1) + "Z" + "I" * qubit)
             pauli_z = pauli_z.evolve(clifford_adj, frame="s")
-            list_pairs = []
-            pauli_count = 0
 
             # Compute the CNOT cost in order to find the qubit with the minimal cost
-            for i in qubit_list:
-                typeq = _from_pair_paulis_to_type(pauli_x, pauli_z, i)
-                list_pairs.append(typeq)
-                pauli_count += 1
-            cost = _compute_greedy_cost(list_pairs)
+            pair_classes = _from_pair_paulis_to_classes(pauli_x, pauli_z, qubit_list)
+            cost = _compute_greedy_cost(pair_classes)
             list_greedy_cost.append([cost, qubit])
 
         _, min_qubit = (sorted(list_greedy_cost))[0]
@@ -104,7 +99,7 @@ def synth_clifford_greedy(clifford: Clifford) -> QuantumCircuit:
         decouple_circ, decouple_cliff = _calc_decoupling(
             pauli_x, pauli_z, qubit_list, min_qubit, num_qubits, clifford_cpy
         )
-        circ = circ.compose(decouple_circ)
+        circ.compose(decouple_circ, inplace=True, copy=False)
 
         # Now the clifford acts trivially on min_qubit
         clifford_cpy = decouple_cliff.adjoint().compose(clifford_cpy)
@@ -166,6 +161,20 @@ D_class = [
 E_class = [[[False, False], [False, False]]]  # 'II'
 
 
+def _pair_code(type_x, type_z):
+    """Packs the four bits of a pair type (as returned by _from_pair_paulis_to_type)
+    into an integer in range(16)."""
+    return 8 * type_x[0] + 4 * type_x[1] + 2 * type_z[0] + type_z[1]
+
+
+# Lookup table from the packed code of a pair of Paulis to the index of its
+# equivalence class: 0 for class A, 1 for B, 2 for C, 3 for D and 4 for E
+_PAIR_CLASS = np.empty(16, dtype=np.intp)
+for _class_index, _pauli_class in enumerate([A_class, B_class, C_class, D_class, E_class]):
+    for _pair in _pauli_class:
+        _PAIR_CLASS[_pair_code(*_pair)] = _class_index
+
+
 def _from_pair_paulis_to_type(pauli_x, pauli_z, qubit):
     """Converts a pair of Paulis pauli_x and pauli_z into a type"""
 
@@ -174,30 +183,33 @@ def _from_pair_paulis_to_type(pauli_x, pauli_z, qubit):
     return [type_x, type_z]
 
 
-def _compute_greedy_cost(list_pairs):
+def _from_pair_paulis_to_classes(pauli_x, pauli_z, qubit_list):
+    """Converts a pair of Paulis pauli_x and pauli_z into the array of the equivalence
+    class indices of their types on all the qubits in qubit_list"""
+
+    codes = _pair_code(
+        [pauli_x.z[qubit_list], pauli_x.x[qubit_list]],
+        [pauli_z.z[qubit_list], pauli_z.x[qubit_list]],
+    )
+    return _PAIR_CLASS[codes]
+
+
+def _compute_greedy_cost(pair_classes):
     """Compute the CNOT cost of one step of the algorithm"""
 
-    A_num = 0
-    B_num = 0
-    C_num = 0
-    D_num = 0
-
-    for pair in list_pairs:
-        if pair in A_class:
-            A_num += 1
-        elif pair in B_class:
-            B_num += 1
-        elif pair in C_class:
-            C_num += 1
-        elif pair in D_class:
-            D_num += 1
+    # Number of qubits in each of the classes A, B, C, D and E
+    class_counts = np.bincount(pair_classes, minlength=5).tolist()
+    A_num = class_counts[0]
+    B_num = class_counts[1]
+    C_num = class_counts[2]
+    D_num = class_counts[3]
 
     if (A_num % 2) == 0:
         raise QiskitError("Symplectic Gaussian elimination fails.")
 
     # Calculate the CNOT cost
     cost = 3 * (A_num - 1) / 2 + (B_num + 1) * (B_num > 0) + C_num + D_num
-    if list_pairs[0] not in A_class:  # additional SWAP
+    if pair_classes[0] != 0:  # not in class A, additional SWAP
         cost += 3
 
     return cost
@@ -17,7 +17,6 @@ for optimal synthesis of linear (CNOT-only) reversible circuits.
 """
 
 from __future__ import annotations
-import copy
 import numpy as np
 from qiskit.circuit import QuantumCircuit
 from qiskit.exceptions import QiskitError
@@ -107,36 +106,50 @@ def _lwr_cnot_synth(state, section_size):
     num_qubits = state.shape[0]
     cutoff = 1
 
+    # Pack each row into a Python integer, with bit ``j`` holding column ``j``. Row additions
+    # over GF(2) then become a single XOR and sub-rows can be compared as plain integers.
+    packed = np.packbits(state, axis=1, bitorder="little")
+    rows = [int.from_bytes(row.tobytes(), "little") for row in packed]
+    section_mask = (1 << section_size) - 1
+
     # Iterate over column sections
     for sec in range(1, int(np.floor(num_qubits / section_size) + 1)):
+        sec_start = (sec - 1) * section_size
         # Remove duplicate sub-rows in section sec
         patt = {}
-        for row in range((sec - 1) * section_size, num_qubits):
-            sub_row_patt = copy.deepcopy(state[row, (sec - 1) * section_size : sec * section_size])
-            if np.sum(sub_row_patt) == 0:
+        for row in range(sec_start, num_qubits):
+            sub_row_patt = (rows[row] >> sec_start) & section_mask
+            if sub_row_patt == 0:
                 continue
-            if str(sub_row_patt) not in patt:
-                patt[str(sub_row_patt)] = row
+            if sub_row_patt not in patt:
+                patt[sub_row_patt] = row
             else:
-                state[row, :] ^= state[patt[str(sub_row_patt)], :]
-                circuit.append([patt[str(sub_row_patt)], row])
+                rows[row] ^= rows[patt[sub_row_patt]]
+                circuit.append([patt[sub_row_patt], row])
         # Use gaussian elimination for remaining entries in column section
-        for col in range((sec - 1) * section_size, sec * section_size):
+        for col in range(sec_start, sec * section_size):
+            col_bit = 1 << col
             # Check if 1 on diagonal
-            diag_one = 1
-            if state[col, col] == 0:
-                diag_one = 0
+            diag_one = rows[col] & col_bit
             # Remove ones in rows below column col
             for row in range(col + 1, num_qubits):
-                if state[row, col] == 1:
-                    if diag_one == 0:
-                        state[col, :] ^= state[row, :]
+                if rows[row] & col_bit:
+                    if not diag_one:
+                        rows[col] ^= rows[row]
                         circuit.append([row, col])
                         diag_one = 1
-                    state[row, :] ^= state[col, :]
+                    rows[row] ^= rows[col]
                     circuit.append([col, row])
                 # Back reduce the pivot row using the current row
-                if sum(state[col, :] & state[row, :]) > cutoff:
-                    state[col, :] ^= state[row, :]
+                if bin(rows[col] & rows[row]).count("1") > cutoff:
+                    rows[col] ^= rows[row]
                     circuit.append([row, col])
+
+    num_bytes = packed.shape[1]
+    packed = np.array(
+        [np.frombuffer(row.to_bytes(num_bytes, "little"), dtype=np.uint8) for row in rows]
+    ).reshape(packed.shape)
+    state = np.unpackbits(packed, axis=1, count=state.shape[1], bitorder="little").astype(
+        state.dtype, copy=False
+    )
     return [state, circuit]
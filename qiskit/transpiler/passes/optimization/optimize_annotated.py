@@ -25,6 +25,23 @@ from qiskit.circuit import (
     Operation,
     ControlFlowOp,
 )
+from qiskit.circuit.library.standard_gates import (
+    XGate,
+    YGate,
+    ZGate,
+    HGate,
+    CXGate,
+    CYGate,
+    CZGate,
+    CHGate,
+    SwapGate,
+    ECRGate,
+    CCXGate,
+    CCZGate,
+    CSwapGate,
+    C3XGate,
+    C4XGate,
+)
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.passes.utils import control_flow
 from qiskit.transpiler.target import Target
@@ -32,6 +49,28 @@ from qiskit.dagcircuit import DAGCircuit
 from qiskit.transpiler.exceptions import TranspilerError
 
 
+# Gates whose inverse is a gate of the same class with the same control state (if any).
+_SELF_INVERSE_GATES = frozenset(
+    (
+        XGate,
+        YGate,
+        ZGate,
+        HGate,
+        CXGate,
+        CYGate,
+        CZGate,
+        CHGate,
+        SwapGate,
+        ECRGate,
+        CCXGate,
+        CCZGate,
+        CSwapGate,
+        C3XGate,
+        C4XGate,
+    )
+)
+
+
 class OptimizeAnnotated(TransformationPass):
     """Optimization pass on circuits with annotated operations.
 
@@ -258,7 +297,7 @@ class OptimizeAnnotated(TransformationPass):
 
                 # in the future we want to include a more precise check whether a pair
                 # of nodes are inverse
-                if front_node.op == back_node.op.inverse():
+                if _are_inverse_ops(front_node.op, back_node.op):
                     # update front_node_for_qubit and back_node_for_qubit
                     for q in front_node.qargs:
                         front_node_for_qubit[q] = None
@@ -303,15 +342,17 @@ class OptimizeAnnotated(TransformationPass):
         front_circuit.global_phase = 0
         back_circuit.global_phase = 0
 
+        # The nodes come from ``dag``, so their wires and conditions are already known to be
+        # valid for DAGs copied from it, and the checks can be skipped.
         for node in front_block:
-            front_circuit.apply_operation_back(node.op, node.qargs, node.cargs)
+            front_circuit.apply_operation_back(node.op, node.qargs, node.cargs, check=False)
 
         for node in back_block:
-            back_circuit.apply_operation_front(node.op, node.qargs, node.cargs)
+            back_circuit.apply_operation_front(node.op, node.qargs, node.cargs, check=False)
 
         for node in dag.op_nodes():
             if node not in processed_nodes:
-                middle_circuit.apply_operation_back(node.op, node.qargs, node.cargs)
+                middle_circuit.apply_operation_back(node.op, node.qargs, node.cargs, check=False)
 
         return front_circuit, middle_circuit, back_circuit
 
@@ -365,11 +406,21 @@ class OptimizeAnnotated(TransformationPass):
         Returns the modified DAG and whether it did something.
         """
         did_something = False
+
+        # Annotated operations in the same DAG often share their base operation, in which case
+        # its decomposition only needs to be computed once. The cache keeps a reference to each
+        # base operation, so that its id cannot be reused by another object.
+        base_decompositions = {}
+
         for node in dag.op_nodes(op=AnnotatedOperation):
             base_op = node.op.base_op
             if not self._skip_definition(base_op):
-                base_dag = circuit_to_dag(base_op.definition, copy_operations=False)
-                base_decomposition = self._conjugate_decomposition(base_dag)
+                if (cached := base_decompositions.get(id(base_op))) is not None:
+                    base_decomposition = cached[1]
+                else:
+                    base_dag = circuit_to_dag(base_op.definition, copy_operations=False)
+                    base_decomposition = self._conjugate_decomposition(base_dag)
+                    base_decompositions[id(base_op)] = (base_op, base_decomposition)
                 if base_decomposition is not None:
                     new_op = self._conjugate_reduce_op(node.op, base_decomposition)
                     dag.substitute_node(node, new_op)
@@ -444,3 +495,13 @@ class OptimizeAnnotated(TransformationPass):
             did_something = did_something or opt
 
         return dag, did_something
+
+
+def _are_inverse_ops(op1: Operation, op2: Operation) -> bool:
+    """Returns True if ``op1`` is equal to the inverse of ``op2``.
+
+    For self-inverse gates this avoids constructing the inverse of ``op2``.
+    """
+    if getattr(op2, "base_class", None) in _SELF_INVERSE_GATES:
+        return op1 is op2 or op1 == op2
+    return op1 == op2.inverse()
@@ -133,6 +133,7 @@ Permutation Synthesis
    TokenSwapperSynthesisPermutation
 """
 
+from functools import lru_cache
 from typing import Optional, Union, List, Tuple, Callable
 
 import numpy as np
@@ -142,14 +143,14 @@ from qiskit.circuit.operation import Operation
 from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.circuit.quantumcircuit import QuantumCircuit
-from qiskit.circuit import ControlFlowOp, ControlledGate, EquivalenceLibrary
-from qiskit.circuit.library import LinearFunction
+from qiskit.circuit import ControlFlowOp, ControlledGate, EquivalenceLibrary, CircuitInstruction
+from qiskit.circuit.library import LinearFunction, SwapGate
 from qiskit.transpiler.passes.utils import control_flow
 from qiskit.transpiler.target import Target
 from qiskit.transpiler.coupling import CouplingMap
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 from qiskit.transpiler.exceptions import TranspilerError
-from qiskit.transpiler.passes.routing.algorithms import ApproximateTokenSwapper
+from qiskit.quantum_info import Clifford
 
 from qiskit.circuit.annotated_operation import (
     AnnotatedOperation,
@@ -170,7 +171,6 @@ from qiskit.synthesis.linear import (
     synth_cnot_depth_line_kms,
     calc_inverse_matrix,
 )
-from qiskit.synthesis.linear.linear_circuits_utils import transpose_cx_circ
 from qiskit.synthesis.permutation import (
     synth_permutation_basic,
     synth_permutation_acg,
@@ -350,6 +350,8 @@ class HighLevelSynthesis(TransformationPass):
             self.hls_config = HLSConfig(True)
 
         self.hls_plugin_manager = HighLevelSynthesisPluginManager()
+        # Resolved synthesis methods for each operation name, see _plugin_methods.
+        self._plugin_methods_cache = {}
         self._coupling_map = coupling_map
         self._target = target
         self._use_qubit_indices = use_qubit_indices
@@ -383,6 +385,13 @@ class HighLevelSynthesis(TransformationPass):
         # copy dag_op_nodes because we are modifying the DAG below
         dag_op_nodes = dag.op_nodes()
 
+        # the qubits of the DAG are not changed below, so their indices can be computed once
+        qubit_indices = (
+            {bit: index for index, bit in enumerate(dag.qubits)}
+            if self._use_qubit_indices
+            else None
+        )
+
         for node in dag_op_nodes:
             if isinstance(node.op, ControlFlowOp):
                 node.op = control_flow.map_blocks(self.run, node.op)
@@ -394,9 +403,7 @@ class HighLevelSynthesis(TransformationPass):
             if dag.has_calibration_for(node) or len(node.qargs) < self._min_qubits:
                 continue
 
-            qubits = (
-                [dag.find_bit(x).index for x in node.qargs] if self._use_qubit_indices else None
-            )
+            qubits = [qubit_indices[x] for x in node.qargs] if self._use_qubit_indices else None
 
             decomposition, modified = self._recursively_handle_op(node.op, qubits)
 
@@ -490,35 +497,44 @@ class HighLevelSynthesis(TransformationPass):
         dag = self.run(dag)
         return dag, True
 
-    def _synthesize_op_using_plugins(
-        self, op: Operation, qubits: List
-    ) -> Union[QuantumCircuit, None]:
-        """
-        Attempts to synthesize op using plugin mechanism.
-        Returns either the synthesized circuit or None (which occurs when no
-        synthesis methods are available or specified).
+    def _plugin_methods(self, op_name: str) -> List[Tuple]:
+        """Return the synthesis methods to try for operations named ``op_name``.
+
+        Each method is returned as a tuple consisting of the plugin specifier, the plugin
+        object (or ``None`` if the specifier does not name an available plugin), and the
+        additional plugin arguments. The result only depends on the config's entries for
+        ``op_name`` and on the installed plugins, so it is computed once per operation name
+        rather than for every operation in the circuit, and recomputed whenever these entries
+        change (e.g., after :meth:`.HLSConfig.set_methods`).
         """
+        config_entry = self.hls_config.methods.get(op_name)
+        config_state = (
+            self.hls_config.use_default_on_unspecified,
+            None if config_entry is None else list(config_entry),
+        )
+        cached = self._plugin_methods_cache.get(op_name)
+        if cached is not None and cached[0] == config_state:
+            return cached[1]
+
         hls_plugin_manager = self.hls_plugin_manager
 
-        if op.name in self.hls_config.methods.keys():
+        if config_entry is not None:
             # the operation's name appears in the user-provided config,
             # we use the list of methods provided by the user
-            methods = self.hls_config.methods[op.name]
+            config_methods = config_entry
         elif (
             self.hls_config.use_default_on_unspecified
-            and "default" in hls_plugin_manager.method_names(op.name)
+            and "default" in hls_plugin_manager.method_names(op_name)
         ):
             # the operation's name does not appear in the user-specified config,
             # we use the "default" method when instructed to do so and the "default"
             # method is available
-            methods = ["default"]
+            config_methods = ["default"]
         else:
-            methods = []
-
-        best_decomposition = None
-        best_score = np.inf
+            config_methods = []
 
-        for method in methods:
+        methods = []
+        for method in config_methods:
             # There are two ways to specify a synthesis method. The more explicit
             # way is to specify it as a tuple consisting of a synthesis algorithm and a
             # list of additional arguments, e.g.,
@@ -538,15 +554,38 @@ class HighLevelSynthesis(TransformationPass):
             # or directly as a class inherited from HighLevelSynthesisPlugin (which then
             # does not need to be specified in entry_points).
             if isinstance(plugin_specifier, str):
-                if plugin_specifier not in hls_plugin_manager.method_names(op.name):
-                    raise TranspilerError(
-                        f"Specified method: {plugin_specifier} not found in available "
-                        f"plugins for {op.name}"
-                    )
-                plugin_method = hls_plugin_manager.method(op.name, plugin_specifier)
+                if plugin_specifier in hls_plugin_manager.method_names(op_name):
+                    plugin_method = hls_plugin_manager.method(op_name, plugin_specifier)
+                else:
+                    # Only raise once this method is actually reached, as an earlier
+                    # method may already succeed in the "sequential" mode.
+                    plugin_method = None
             else:
                 plugin_method = plugin_specifier
 
+            methods.append((plugin_specifier, plugin_method, plugin_args))
+
+        self._plugin_methods_cache[op_name] = (config_state, methods)
+        return methods
+
+    def _synthesize_op_using_plugins(
+        self, op: Operation, qubits: List
+    ) -> Union[QuantumCircuit, None]:
+        """
+        Attempts to synthesize op using plugin mechanism.
+        Returns either the synthesized circuit or None (which occurs when no
+        synthesis methods are available or specified).
+        """
+        best_decomposition = None
+        best_score = np.inf
+
+        for plugin_specifier, plugin_method, plugin_args in self._plugin_methods(op.name):
+            if plugin_method is None:
+                raise TranspilerError(
+                    f"Specified method: {plugin_specifier} not found in available "
+                    f"plugins for {op.name}"
+                )
+
             decomposition = plugin_method.run(
                 op,
                 coupling_map=self._coupling_map,
@@ -646,6 +685,111 @@ class HighLevelSynthesis(TransformationPass):
         return None
 
 
+# The synthesis caches below are shared by all plugin instances and live for the whole
+# process, so they are kept small: they only need to hold the few distinct objects that are
+# synthesized over and over again within a transpilation (e.g. the Cliffords of a randomized
+# benchmarking sequence), and the least recently used entries are evicted first.
+_SYNTHESIS_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=_SYNTHESIS_CACHE_SIZE)
+def _cached_clifford_synthesis(
+    synth_function: Callable, num_qubits: int, tableau: bytes
+) -> QuantumCircuit:
+    """Synthesize the Clifford with the given serialized tableau, memoizing the result.
+
+    Workloads such as randomized benchmarking request the same Clifford many times,
+    so the synthesized circuit is cached on the raw tableau bytes. The returned circuit
+    is shared between calls and must not be modified; use :func:`_synthesize_clifford`.
+    """
+    tableau = np.frombuffer(tableau, dtype=bool).reshape(2 * num_qubits, 2 * num_qubits + 1)
+    return synth_function(Clifford(tableau, validate=False))
+
+
+def _synthesize_clifford(synth_function: Callable, cliff: Clifford) -> QuantumCircuit:
+    """Synthesize ``cliff`` using ``synth_function``, reusing previous results if possible."""
+    tableau = np.asarray(cliff.tableau, dtype=bool).tobytes()
+    return _cached_clifford_synthesis(synth_function, cliff.num_qubits, tableau).copy()
+
+
+@lru_cache(maxsize=_SYNTHESIS_CACHE_SIZE)
+def _cached_linear_synthesis(
+    synth_function: Callable, num_qubits: int, linear: bytes, *args
+) -> QuantumCircuit:
+    """Synthesize the linear function with the given serialized matrix, memoizing the result.
+
+    The returned circuit is shared between calls and must not be modified;
+    use :func:`_synthesize_linear`.
+    """
+    # The linear synthesis functions copy the matrix before reducing it, so they can be
+    # given a read-only view of the key bytes directly.
+    mat = np.frombuffer(linear, dtype=bool).reshape(num_qubits, num_qubits)
+    return synth_function(mat, *args)
+
+
+def _synthesize_linear(synth_function: Callable, linear: np.ndarray, *args) -> QuantumCircuit:
+    """Synthesize the matrix ``linear`` using ``synth_function``, reusing previous results
+    if possible. The extra ``args`` are passed on to ``synth_function`` and must be hashable.
+    """
+    mat = np.asarray(linear, dtype=bool)
+    return _cached_linear_synthesis(synth_function, len(mat), mat.tobytes(), *args).copy()
+
+
+def _transform_cx_circuit(
+    circuit: QuantumCircuit, use_inverted: bool, use_transposed: bool
+) -> QuantumCircuit:
+    """Return the inverse and/or the transpose of a circuit consisting only of CX gates.
+
+    Inverting a CX circuit reverses the order of its gates, and transposing it additionally
+    swaps the control and target of every gate. The combination is therefore built in a
+    single pass over ``circuit``, rather than by chaining :func:`.transpose_cx_circ` and
+    :meth:`.QuantumCircuit.inverse`.
+    """
+    if not use_inverted and not use_transposed:
+        return circuit
+
+    name = circuit.name
+    if use_transposed:
+        name += "_transpose"
+    if use_inverted:
+        name += "_dg"
+    if use_transposed:
+        # As in transpose_cx_circ, the transposed circuit is defined over the bare qubits.
+        transformed = QuantumCircuit(circuit.qubits, name=name)
+    else:
+        # As in QuantumCircuit.inverse, the inverted circuit keeps the registers.
+        transformed = QuantumCircuit(
+            circuit.qubits, *circuit.qregs, name=name, global_phase=-circuit.global_phase
+        )
+
+    data = circuit.data if use_inverted == use_transposed else reversed(circuit.data)
+    if use_transposed:
+        for instruction in data:
+            transformed._append(instruction.replace(qubits=instruction.qubits[::-1]))
+    else:
+        for instruction in data:
+            transformed._append(instruction)
+    return transformed
+
+
+def _synth_linear_transformed(
+    mat: np.ndarray, synth_function: Callable, use_inverted: bool, use_transposed: bool, *args
+) -> QuantumCircuit:
+    """Run ``synth_function`` (with the additional ``args``), optionally on the inverted
+    and/or transposed matrix."""
+    # Since (A^T)^{-1} = (A^{-1})^T, invert first so that the inverse is computed from the
+    # contiguous input matrix, and then copy the transposed matrix into a contiguous array,
+    # so that the synthesis function does not work on a strided transposed view either.
+    if use_inverted:
+        mat = calc_inverse_matrix(mat)
+    if use_transposed:
+        mat = np.ascontiguousarray(np.transpose(mat))
+
+    decomposition = synth_function(mat, *args)
+
+    return _transform_cx_circuit(decomposition, use_inverted, use_transposed)
+
+
 class DefaultSynthesisClifford(HighLevelSynthesisPlugin):
     """The default clifford synthesis plugin.
 
@@ -659,7 +803,7 @@ class DefaultSynthesisClifford(HighLevelSynthesisPlugin):
 
     def run(self, high_level_object, coupling_map=None, target=None, qubits=None, **options):
         """Run synthesis for the given Clifford."""
-        decomposition = synth_clifford_full(high_level_object)
+        decomposition = _synthesize_clifford(synth_clifford_full, high_level_object)
         return decomposition
 
 
@@ -672,7 +816,7 @@ class AGSynthesisClifford(HighLevelSynthesisPlugin):
 
     def run(self, high_level_object, coupling_map=None, target=None, qubits=None, **options):
         """Run synthesis for the given Clifford."""
-        decomposition = synth_clifford_ag(high_level_object)
+        decomposition = _synthesize_clifford(synth_clifford_ag, high_level_object)
         return decomposition
 
 
@@ -689,7 +833,7 @@ class BMSynthesisClifford(HighLevelSynthesisPlugin):
     def run(self, high_level_object, coupling_map=None, target=None, qubits=None, **options):
         """Run synthesis for the given Clifford."""
         if high_level_object.num_qubits <= 3:
-            decomposition = synth_clifford_bm(high_level_object)
+            decomposition = _synthesize_clifford(synth_clifford_bm, high_level_object)
         else:
             decomposition = None
         return decomposition
@@ -705,7 +849,7 @@ class GreedySynthesisClifford(HighLevelSynthesisPlugin):
 
     def run(self, high_level_object, coupling_map=None, target=None, qubits=None, **options):
         """Run synthesis for the given Clifford."""
-        decomposition = synth_clifford_greedy(high_level_object)
+        decomposition = _synthesize_clifford(synth_clifford_greedy, high_level_object)
         return decomposition
 
 
@@ -719,7 +863,7 @@ class LayerSynthesisClifford(HighLevelSynthesisPlugin):
 
     def run(self, high_level_object, coupling_map=None, target=None, qubits=None, **options):
         """Run synthesis for the given Clifford."""
-        decomposition = synth_clifford_layers(high_level_object)
+        decomposition = _synthesize_clifford(synth_clifford_layers, high_level_object)
         return decomposition
 
 
@@ -734,7 +878,7 @@ class LayerLnnSynthesisClifford(HighLevelSynthesisPlugin):
 
     def run(self, high_level_object, coupling_map=None, target=None, qubits=None, **options):
         """Run synthesis for the given Clifford."""
-        decomposition = synth_clifford_depth_lnn(high_level_object)
+        decomposition = _synthesize_clifford(synth_clifford_depth_lnn, high_level_object)
         return decomposition
 
 
@@ -747,7 +891,7 @@ class DefaultSynthesisLinearFunction(HighLevelSynthesisPlugin):
 
     def run(self, high_level_object, coupling_map=None, target=None, qubits=None, **options):
         """Run synthesis for the given LinearFunction."""
-        decomposition = synth_cnot_count_full_pmh(high_level_object.linear)
+        decomposition = _synthesize_linear(synth_cnot_count_full_pmh, high_level_object.linear)
         return decomposition
 
 
@@ -779,19 +923,13 @@ class KMSSynthesisLinearFunction(HighLevelSynthesisPlugin):
         use_inverted = options.get("use_inverted", False)
         use_transposed = options.get("use_transposed", False)
 
-        mat = high_level_object.linear.astype(bool, copy=False)
-
-        if use_transposed:
-            mat = np.transpose(mat)
-        if use_inverted:
-            mat = calc_inverse_matrix(mat)
-
-        decomposition = synth_cnot_depth_line_kms(mat)
-
-        if use_transposed:
-            decomposition = transpose_cx_circ(decomposition)
-        if use_inverted:
-            decomposition = decomposition.inverse()
+        decomposition = _synthesize_linear(
+            _synth_linear_transformed,
+            high_level_object.linear,
+            synth_cnot_depth_line_kms,
+            use_inverted,
+            use_transposed,
+        )
 
         return decomposition
 
@@ -831,19 +969,14 @@ class PMHSynthesisLinearFunction(HighLevelSynthesisPlugin):
         use_inverted = options.get("use_inverted", False)
         use_transposed = options.get("use_transposed", False)
 
-        mat = high_level_object.linear.astype(bool, copy=False)
-
-        if use_transposed:
-            mat = np.transpose(mat)
-        if use_inverted:
-            mat = calc_inverse_matrix(mat)
-
-        decomposition = synth_cnot_count_full_pmh(mat, section_size=section_size)
-
-        if use_transposed:
-            decomposition = transpose_cx_circ(decomposition)
-        if use_inverted:
-            decomposition = decomposition.inverse()
+        decomposition = _synthesize_linear(
+            _synth_linear_transformed,
+            high_level_object.linear,
+            synth_cnot_count_full_pmh,
+            use_inverted,
+            use_transposed,
+            section_size,
+        )
 
         return decomposition
 
@@ -887,6 +1020,72 @@ class ACGSynthesisPermutation(HighLevelSynthesisPlugin):
         return decomposition
 
 
+@lru_cache(maxsize=_SYNTHESIS_CACHE_SIZE)
+def _token_swapper_graph(
+    num_qubits: int, edges: Optional[Tuple[Tuple[int, int], ...]]
+) -> rx.PyGraph:
+    """Return the undirected version of the coupling map on ``num_qubits`` qubits with the
+    given directed ``edges``, or of the fully connected coupling map if ``edges`` is ``None``.
+
+    The graph is cached for repeated synthesis of permutations over the same connectivity,
+    and is shared between calls, so it must not be modified.
+    """
+    if edges is None:
+        coupling_graph = CouplingMap.from_full(num_qubits).graph
+    else:
+        coupling_graph = rx.PyDiGraph()
+        coupling_graph.add_nodes_from(range(num_qubits))
+        coupling_graph.extend_from_edge_list(edges)
+    return coupling_graph.to_undirected()
+
+
+def _token_swaps(
+    num_qubits: int,
+    edges: Optional[Tuple[Tuple[int, int], ...]],
+    pattern: Tuple[int, ...],
+    trials: int,
+    seed: Union[int, np.random.Generator, None],
+    parallel_threshold: int,
+) -> Optional[Tuple[Tuple[int, int], ...]]:
+    """Return the swaps found by the token swapper to implement ``pattern`` over the
+    connectivity described by ``num_qubits`` and ``edges`` (see :func:`_token_swapper_graph`),
+    or ``None`` if the permutation cannot be implemented over that connectivity.
+    """
+    graph = _token_swapper_graph(num_qubits, edges)
+
+    # As in ApproximateTokenSwapper.map, rustworkx is given an integer seed drawn from the
+    # random number generator. The generator is local to this call, so that concurrent calls
+    # do not share any mutable state.
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    rx_seed = rng.integers(1, 10000)
+
+    # Map each target qubit to its source position.
+    pattern_as_dict = dict(zip(pattern, range(len(pattern))))
+    try:
+        swaps = rx.graph_token_swapper(graph, pattern_as_dict, trials, rx_seed, parallel_threshold)
+    except rx.InvalidMapping:
+        return None
+
+    return tuple(map(tuple, swaps))
+
+
+# Like the Clifford and linear function synthesis caches, this cache is shared by all plugin
+# instances for the whole process, so it is bounded by the same small size.
+@lru_cache(maxsize=_SYNTHESIS_CACHE_SIZE)
+def _cached_token_swaps(
+    num_qubits: int,
+    edges: Optional[Tuple[Tuple[int, int], ...]],
+    pattern: Tuple[int, ...],
+    trials: int,
+    seed: int,
+    parallel_threshold: int,
+) -> Optional[Tuple[Tuple[int, int], ...]]:
+    """A cached version of :func:`_token_swaps`, valid only for integer seeds, for which
+    the swapper's result is fully determined by the arguments.
+    """
+    return _token_swaps(num_qubits, edges, pattern, trials, seed, parallel_threshold)
+
+
 class TokenSwapperSynthesisPermutation(HighLevelSynthesisPlugin):
     """The permutation synthesis plugin based on the token swapper algorithm.
 
@@ -927,15 +1126,17 @@ class TokenSwapperSynthesisPermutation(HighLevelSynthesisPlugin):
         seed = options.get("seed", 0)
         parallel_threshold = options.get("parallel_threshold", 50)
 
-        pattern = high_level_object.pattern
-        pattern_as_dict = {j: i for i, j in enumerate(pattern)}
+        pattern = tuple(np.asarray(high_level_object.pattern).tolist())
+        if pattern == tuple(range(len(pattern))):
+            # The identity permutation needs no swaps over any connectivity.
+            return QuantumCircuit(len(pattern))
 
         # When the plugin is called from the HighLevelSynthesis transpiler pass,
         # the coupling map already takes target into account.
         if coupling_map is None or qubits is None:
             # The abstract synthesis uses a fully connected coupling map, allowing
             # arbitrary connections between qubits.
-            used_coupling_map = CouplingMap.from_full(len(pattern))
+            num_qubits, edges = len(pattern), None
         else:
             # The concrete synthesis uses the coupling map restricted to the set of
             # qubits over which the permutation gate is defined. If we allow using other
@@ -943,22 +1144,37 @@ class TokenSwapperSynthesisPermutation(HighLevelSynthesisPlugin):
             # defines this PermutationGate by the DAG corresponding to the constructed
             # decomposition becomes problematic. Note that we allow the reduced
             # coupling map to be disconnected.
-            used_coupling_map = coupling_map.reduce(qubits, check_if_connected=False)
-
-        graph = used_coupling_map.graph.to_undirected()
-        swapper = ApproximateTokenSwapper(graph, seed=seed)
+            qubit_index = {qubit: index for index, qubit in enumerate(qubits)}
+            num_qubits = len(qubits)
+            edges = tuple(
+                (qubit_index[edge[0]], qubit_index[edge[1]])
+                for edge in coupling_map.get_edges()
+                if edge[0] in qubit_index and edge[1] in qubit_index
+            )
 
-        try:
-            swapper_result = swapper.map(
-                pattern_as_dict, trials, parallel_threshold=parallel_threshold
+        if seed is None or isinstance(seed, np.random.Generator):
+            # The result depends on random state outside of the arguments, so it
+            # cannot be reused.
+            swapper_result = _token_swaps(
+                num_qubits, edges, pattern, trials, seed, parallel_threshold
+            )
+        else:
+            swapper_result = _cached_token_swaps(
+                num_qubits, edges, pattern, trials, seed, parallel_threshold
             )
-        except rx.InvalidMapping:
-            swapper_result = None
 
         if swapper_result is not None:
-            decomposition = QuantumCircuit(len(graph.node_indices()))
-            for swap in swapper_result:
-                decomposition.swap(*swap)
+            # As for the identity permutation, the circuit is defined over a register of
+            # ``num_qubits`` qubits.
+            decomposition = QuantumCircuit(num_qubits)
+            # The swaps are known to act on distinct qubits of the new circuit, so bypass
+            # the argument checking and broadcasting of QuantumCircuit.swap.
+            circuit_qubits = decomposition.qubits
+            swap_gate = SwapGate()
+            for qubit0, qubit1 in swapper_result:
+                decomposition._append(
+                    CircuitInstruction(swap_gate, (circuit_qubits[qubit0], circuit_qubits[qubit1]))
+                )
             return decomposition
 
         return None
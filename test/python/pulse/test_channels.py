@@ -12,8 +12,13 @@
 
 """Test cases for the pulse channel group."""
 
+import pickle
+import subprocess
+import sys
 import unittest
 
+from qiskit.circuit import Parameter
+from qiskit.pulse import Constant, Delay, Play
 from qiskit.pulse.channels import (
     AcquireChannel,
     Channel,
@@ -39,6 +44,75 @@ class TestChannel(QiskitTestCase):
             Channel(0)
 
 
+class TestChannelPickle(QiskitTestCase):
+    """Test pickling of channels."""
+
+    def test_pickle_round_trip(self):
+        """Test unpickled channels are equal to, and hash as, the original channels."""
+        param = Parameter("u")
+        for channel in [
+            DriveChannel(0),
+            ControlChannel(3),
+            ControlChannel(param),
+            MemorySlot(1),
+            SnapshotChannel(),
+        ]:
+            with self.subTest(channel=channel):
+                loaded = pickle.loads(pickle.dumps(channel))
+                self.assertEqual(loaded, channel)
+                self.assertEqual(hash(loaded), hash(channel))
+
+    def test_unpickle_dict_state(self):
+        """Test unpickling channels pickled with their instance dictionary as state."""
+
+        class _LegacyPickle:
+            """Pickles as a channel of type ``channel_type`` with dictionary state."""
+
+            def __init__(self, channel_type, state):
+                self.channel_type = channel_type
+                self.state = state
+
+            def __reduce__(self):
+                return object.__new__, (self.channel_type,), self.state
+
+        for channel in [DriveChannel(2), MemorySlot(0), ControlChannel(Parameter("u"))]:
+            with self.subTest(channel=channel):
+                legacy = pickle.dumps(_LegacyPickle(type(channel), {"_index": channel.index}))
+                loaded = pickle.loads(legacy)
+                self.assertIs(type(loaded), type(channel))
+                self.assertEqual(loaded.index, channel.index)
+                self.assertEqual(loaded, channel)
+                self.assertEqual(hash(loaded), hash(channel))
+
+    def test_pickle_schedule_across_processes(self):
+        """Test channel lookups in a schedule pickled in another process."""
+        code = (
+            "import pickle, sys\n"
+            "from qiskit.pulse import Constant, Delay, Play, Schedule\n"
+            "from qiskit.pulse.channels import ControlChannel, DriveChannel\n"
+            "sched = Schedule()\n"
+            "sched += Play(Constant(10, 0.1), DriveChannel(0))\n"
+            "sched += Delay(20, ControlChannel(1))\n"
+            "sys.stdout.buffer.write(pickle.dumps(sched))\n"
+        )
+        pickled = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True
+        ).stdout
+        sched = pickle.loads(pickled)
+
+        self.assertIn(DriveChannel(0), set(sched.channels))
+        self.assertEqual(sched.ch_stop_time(DriveChannel(0)), 10)
+        self.assertEqual(sched.ch_stop_time(ControlChannel(1)), 20)
+
+        # Inserting on a fresh channel equal to a loaded one must detect the overlap.
+        with self.assertRaises(PulseError):
+            sched.insert(5, Play(Constant(10, 0.1), DriveChannel(0)), inplace=True)
+
+        sched.insert(10, Delay(5, DriveChannel(0)), inplace=True)
+        self.assertEqual(len(sched.channels), 2)
+        self.assertEqual(sched.ch_stop_time(DriveChannel(0)), 15)
+
+
 class TestPulseChannel(QiskitTestCase):
     """Test base pulse channel."""
 
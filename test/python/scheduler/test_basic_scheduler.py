@@ -38,6 +38,9 @@ from qiskit.providers.fake_provider import (
     FakeOpenPulse3Q,
     GenericBackendV2,
 )
+from qiskit.scheduler import ScheduleConfig
+from qiskit.scheduler.lowering import lower_gates
+from qiskit.scheduler.schedule_circuit import schedule_circuit, schedule_circuits
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
 
@@ -216,6 +219,40 @@ class TestBasicSchedule(QiskitTestCase):
         self.assertEqual(insts[4][0], 11)  # xp_d0
         self.assertEqual(insts[5][0], 13)  # cr90m_u0
 
+    def test_repeated_gates_lowered_separately(self):
+        """Test that repeated identical gates are lowered to equal but distinct schedules,
+        so that modifying one of them does not change the others."""
+        qc = QuantumCircuit(2)
+        qc.cx(0, 1)
+        qc.x(0)
+        qc.cx(0, 1)
+        qc.x(0)
+        qc.cx(0, 1)
+        schedule_config = ScheduleConfig(
+            inst_map=self.inst_map,
+            meas_map=self.backend.configuration().meas_map,
+            dt=self.backend.configuration().dt,
+        )
+        circ_pulse_defs = lower_gates(qc, schedule_config)
+        self.assertEqual(len(circ_pulse_defs), 5)
+
+        cx_defs = circ_pulse_defs[0::2]
+        for cx_def in cx_defs:
+            self.assertEqual(cx_def.qubits, [0, 1])
+            self.assertEqual(cx_def.schedule, cx_defs[0].schedule)
+        self.assertEqual(len({id(cx_def.schedule) for cx_def in cx_defs}), 3)
+        self.assertIsNot(circ_pulse_defs[1].schedule, circ_pulse_defs[3].schedule)
+
+        duration = cx_defs[0].schedule.duration
+        cx_defs[1].schedule.insert(
+            duration, Play(Gaussian(10, 0.1, 2), DriveChannel(0)), inplace=True
+        )
+        self.assertEqual(cx_defs[0].schedule.duration, duration)
+        self.assertEqual(cx_defs[2].schedule.duration, duration)
+        self.assertEqual(cx_defs[1].schedule.duration, duration + 10)
+        self.assertEqual(cx_defs[0].schedule, cx_defs[2].schedule)
+        self.assertNotEqual(cx_defs[0].schedule, cx_defs[1].schedule)
+
     def test_measure_combined(self):
         """
         Test to check for measure on the same qubit which generated another measure schedule.
@@ -290,6 +327,26 @@ class TestBasicSchedule(QiskitTestCase):
             self.assertEqual(actual[0], expected[0])
             self.assertEqual(actual[1], expected[1])
 
+    def test_schedule_circuits(self):
+        """Test scheduling a list of circuits matches scheduling them one at a time."""
+        q = QuantumRegister(2)
+        c = ClassicalRegister(2)
+        qc0 = QuantumCircuit(q, c)
+        qc0.cx(q[0], q[1])
+        qc1 = QuantumCircuit(q, c)
+        qc1.append(U2Gate(0.5, 0.25), [q[1]])
+        qc1.measure(q, c)
+        schedule_config = ScheduleConfig(
+            inst_map=self.inst_map,
+            meas_map=self.backend.configuration().meas_map,
+            dt=self.backend.configuration().dt,
+        )
+        schedules = schedule_circuits([qc0, qc1], schedule_config, method="asap")
+        self.assertEqual(len(schedules), 2)
+        for circuit, sched in zip([qc0, qc1], schedules):
+            expected = schedule_circuit(circuit, schedule_config, method="asap")
+            self.assertEqual(sched.instructions, expected.instructions)
+
     def test_circuit_name_kept(self):
         """Test that the new schedule gets its name from the circuit."""
         q = QuantumRegister(2)
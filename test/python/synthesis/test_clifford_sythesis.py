@@ -13,21 +13,43 @@
 # pylint: disable=invalid-name
 """Tests for Clifford synthesis functions."""
 
+import itertools
+
 import numpy as np
 from ddt import ddt
 from qiskit.circuit.random import random_clifford_circuit
-from qiskit.quantum_info.operators import Clifford
+from qiskit.quantum_info.operators import Clifford, Pauli
 from qiskit.synthesis.clifford import (
     synth_clifford_full,
     synth_clifford_ag,
     synth_clifford_bm,
     synth_clifford_greedy,
 )
+from qiskit.synthesis.clifford.clifford_decompose_greedy import (
+    A_class,
+    B_class,
+    C_class,
+    D_class,
+    E_class,
+    _PAIR_CLASS,
+    _pair_code,
+    _from_pair_paulis_to_type,
+    _from_pair_paulis_to_classes,
+)
 
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 from test import combine  # pylint: disable=wrong-import-order
 
 
+def _pair_class_index(pair):
+    """The index of the equivalence class of a pair type, found by testing membership
+    in each class in turn, as the greedy synthesis originally did."""
+    for index, pauli_class in enumerate([A_class, B_class, C_class, D_class, E_class]):
+        if pair in pauli_class:
+            return index
+    raise ValueError(f"{pair} is not in any class")
+
+
 @ddt
 class TestCliffordSynthesis(QiskitTestCase):
     """Tests for clifford synthesis functions."""
@@ -105,6 +127,34 @@ class TestCliffordSynthesis(QiskitTestCase):
             value = Clifford(synth_circ)
             self.assertEqual(value, target)
 
+    def test_greedy_pair_class_table(self):
+        """Test that the lookup table of the greedy synthesis classifies each of the
+        16 pair types in the same class as the class membership tests."""
+        codes = set()
+        for bits in itertools.product([False, True], repeat=4):
+            pair = [list(bits[:2]), list(bits[2:])]
+            code = _pair_code(*pair)
+            codes.add(code)
+            with self.subTest(pair=pair):
+                self.assertEqual(_PAIR_CLASS[code], _pair_class_index(pair))
+        self.assertEqual(codes, set(range(16)))
+
+    def test_greedy_pair_classes_of_paulis(self):
+        """Test that the pair classes computed for all qubits at once in the greedy
+        synthesis match the classes of the per-qubit pair types."""
+        rng = np.random.default_rng(1234)
+        num_qubits = 6
+        for _ in range(20):
+            pauli_x = Pauli("".join(rng.choice(list("IXYZ"), num_qubits)))
+            pauli_z = Pauli("".join(rng.choice(list("IXYZ"), num_qubits)))
+            qubit_list = rng.permutation(num_qubits)[: rng.integers(1, num_qubits + 1)].tolist()
+            expected = [
+                _pair_class_index(_from_pair_paulis_to_type(pauli_x, pauli_z, qubit))
+                for qubit in qubit_list
+            ]
+            classes = _from_pair_paulis_to_classes(pauli_x, pauli_z, qubit_list)
+            self.assertEqual(classes.tolist(), expected)
+
     @combine(num_qubits=[1, 2, 3, 4, 5])
     def test_synth_full(self, num_qubits):
         """Test synthesis for set of {num_qubits}-qubit Cliffords"""
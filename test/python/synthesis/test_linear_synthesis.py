@@ -30,6 +30,57 @@ from qiskit.synthesis.linear.linear_circuits_utils import transpose_cx_circ, opt
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
 
+def _reference_lwr_cnot_synth(state, section_size):
+    """Reference implementation of the elimination step of the Patel-Markov-Hayes algorithm,
+    operating directly on the rows of the boolean matrix ``state``."""
+    circuit = []
+    num_qubits = state.shape[0]
+    cutoff = 1
+
+    for sec in range(1, int(np.floor(num_qubits / section_size) + 1)):
+        patt = {}
+        for row in range((sec - 1) * section_size, num_qubits):
+            sub_row_patt = state[row, (sec - 1) * section_size : sec * section_size].copy()
+            if np.sum(sub_row_patt) == 0:
+                continue
+            if str(sub_row_patt) not in patt:
+                patt[str(sub_row_patt)] = row
+            else:
+                state[row, :] ^= state[patt[str(sub_row_patt)], :]
+                circuit.append([patt[str(sub_row_patt)], row])
+        for col in range((sec - 1) * section_size, sec * section_size):
+            diag_one = 1
+            if state[col, col] == 0:
+                diag_one = 0
+            for row in range(col + 1, num_qubits):
+                if state[row, col] == 1:
+                    if diag_one == 0:
+                        state[col, :] ^= state[row, :]
+                        circuit.append([row, col])
+                        diag_one = 1
+                    state[row, :] ^= state[col, :]
+                    circuit.append([col, row])
+                if sum(state[col, :] & state[row, :]) > cutoff:
+                    state[col, :] ^= state[row, :]
+                    circuit.append([row, col])
+    return [state, circuit]
+
+
+def _reference_synth_cnot_count_full_pmh(state, section_size):
+    """Reference implementation of :func:`.synth_cnot_count_full_pmh`."""
+    state = np.array(state)
+    [state, circuit_l] = _reference_lwr_cnot_synth(state, section_size)
+    state = np.transpose(state)
+    [state, circuit_u] = _reference_lwr_cnot_synth(state, section_size)
+    circuit_l.reverse()
+    for i in circuit_u:
+        i.reverse()
+    circ = QuantumCircuit(state.shape[0])
+    for i in circuit_u + circuit_l:
+        circ.cx(i[0], i[1])
+    return circ
+
+
 @ddt
 class TestLinearSynth(QiskitTestCase):
     """Test the linear reversible circuit synthesis functions."""
@@ -103,6 +154,18 @@ class TestLinearSynth(QiskitTestCase):
         self.assertEqual(optimized_qc.depth(), 15)
         self.assertEqual(optimized_qc.count_ops()["cx"], 23)
 
+    @data(1, 2, 3, 4, 5)
+    def test_pmh_matches_reference(self, section_size):
+        """Test that synth_cnot_count_full_pmh produces the same circuits as the reference
+        implementation, including for widths that are not a multiple of the section size."""
+        for num_qubits in [1, 5, 7, 8, 10, 13, 16]:
+            for seed in range(3):
+                with self.subTest(num_qubits=num_qubits, seed=seed):
+                    mat = random_invertible_binary_matrix(num_qubits, seed=seed).astype(bool)
+                    expected = _reference_synth_cnot_count_full_pmh(mat, section_size)
+                    qc = synth_cnot_count_full_pmh(mat, section_size)
+                    self.assertEqual(qc, expected)
+
     @data(5, 6)
     def test_invertible_matrix(self, n):
         """Test the functions for generating a random invertible matrix and inverting it."""
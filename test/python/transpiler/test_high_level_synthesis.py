@@ -15,6 +15,7 @@ Tests the interface for HighLevelSynthesis transpiler pass.
 """
 import itertools
 import unittest.mock
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 from qiskit.circuit import (
@@ -43,7 +44,11 @@ from qiskit.circuit.library import (
 )
 from qiskit.circuit.library.generalized_gates import LinearFunction
 from qiskit.quantum_info import Clifford
-from qiskit.synthesis.linear import random_invertible_binary_matrix
+from qiskit.synthesis.linear import (
+    random_invertible_binary_matrix,
+    synth_cnot_depth_line_kms,
+    calc_inverse_matrix,
+)
 from qiskit.transpiler.passes.synthesis.plugin import (
     HighLevelSynthesisPlugin,
     HighLevelSynthesisPluginManager,
@@ -287,6 +292,36 @@ class TestHighLevelSynthesisInterface(QiskitTestCase):
             self.assertEqual(ops["id"], 4)
             self.assertEqual(ops["cx"], 1)
 
+    def test_set_methods_on_reused_pass(self):
+        """Check that changing the synthesis methods in the config is taken into account
+        when the same HighLevelSynthesis pass is run again.
+        """
+        qc = self.create_circ()
+        mock_plugin_manager = MockPluginManager
+        with unittest.mock.patch(
+            "qiskit.transpiler.passes.synthesis.high_level_synthesis.HighLevelSynthesisPluginManager",
+            wraps=mock_plugin_manager,
+        ):
+            hls_config = HLSConfig(op_a=[("repeat", {"n": 2})])
+            hls = HighLevelSynthesis(hls_config=hls_config)
+            ops = hls(qc).count_ops()
+            self.assertEqual(ops["id"], 4)
+            self.assertEqual(ops["op_b"], 1)
+
+            hls_config.set_methods("op_a", [("repeat", {"n": 3})])
+            hls_config.set_methods("op_b", ["simple"])
+            ops = hls(qc).count_ops()
+            self.assertNotIn("op_b", ops.keys())
+            self.assertEqual(ops["id"], 6)
+            self.assertEqual(ops["cx"], 1)
+
+            hls_config.use_default_on_unspecified = False
+            hls_config.methods.pop("op_a")
+            ops = hls(qc).count_ops()
+            self.assertNotIn("id", ops.keys())
+            self.assertEqual(ops["op_a"], 2)
+            self.assertEqual(ops["cx"], 1)
+
     def test_synthesis_returns_none(self):
         """Check that when synthesis method is specified but returns None,
         the operation does not get synthesized.
@@ -711,6 +746,18 @@ class TestKMSSynthesisLinearFunctionPlugin(QiskitTestCase):
             self.assertEqual(qct.size(), 87)
             self.assertEqual(qct.depth(), 32)
 
+    def test_invert_keeps_registers(self):
+        """Test that the circuit synthesized with only use_inverted set has the same
+        registers as the inverse of the directly synthesized circuit."""
+        linear_function = LinearFunction(self.construct_linear_circuit(7))
+        plugin = HighLevelSynthesisPluginManager().method("linear_function", "kms")
+
+        qct = plugin.run(linear_function, use_inverted=True)
+        expected = synth_cnot_depth_line_kms(calc_inverse_matrix(linear_function.linear)).inverse()
+        self.assertEqual(qct.qregs, [QuantumRegister(7, "q")])
+        self.assertEqual(qct.qregs, expected.qregs)
+        self.assertEqual(qct, expected)
+
 
 class TestTokenSwapperPermutationPlugin(QiskitTestCase):
     """Tests for the token swapper plugin for synthesizing permutation gates."""
@@ -894,6 +941,93 @@ class TestTokenSwapperPermutationPlugin(QiskitTestCase):
                 self.assertIn(qubits, edges)
 
 
+class TestSynthesisPluginCaching(QiskitTestCase):
+    """Tests for reusing previously synthesized Cliffords, linear functions and permutations."""
+
+    def test_repeated_clifford(self):
+        """Test that synthesizing the same Clifford repeatedly gives equal but
+        independent circuits."""
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.s(2)
+        qc.cx(2, 0)
+        plugin = HighLevelSynthesisPluginManager().method("clifford", "greedy")
+
+        first = plugin.run(Clifford(qc))
+        second = plugin.run(Clifford(qc))
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        first.x(0)
+        third = plugin.run(Clifford(qc))
+        self.assertEqual(second, third)
+        self.assertEqual(Operator(third), Operator(qc))
+
+    def test_repeated_token_swapper(self):
+        """Test that synthesizing the same permutation repeatedly with the token swapper
+        gives equal but independent circuits."""
+        perm = PermutationGate([4, 6, 3, 7, 1, 2, 0, 5])
+        coupling_map = CouplingMap.from_ring(8)
+        qubits = list(range(8))
+        plugin = HighLevelSynthesisPluginManager().method("permutation", "token_swapper")
+
+        first = plugin.run(perm, coupling_map=coupling_map, qubits=qubits, seed=1234)
+        second = plugin.run(perm, coupling_map=coupling_map, qubits=qubits, seed=1234)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        first.x(0)
+        third = plugin.run(perm, coupling_map=coupling_map, qubits=qubits, seed=1234)
+        self.assertEqual(second, third)
+        self.assertEqual(Operator(third), Operator(perm))
+
+    def test_token_swapper_seeds_in_threads(self):
+        """Test that concurrent token swapper syntheses over the same connectivity each use
+        their own seed."""
+        perm = PermutationGate([4, 6, 3, 7, 1, 2, 0, 5])
+        coupling_map = CouplingMap.from_ring(8)
+        qubits = list(range(8))
+        plugin = HighLevelSynthesisPluginManager().method("permutation", "token_swapper")
+        seeds = range(16)
+
+        expected = [
+            plugin.run(perm, coupling_map=coupling_map, qubits=qubits, seed=seed) for seed in seeds
+        ]
+
+        def synthesize(seed):
+            rng = np.random.default_rng(seed)
+            return plugin.run(perm, coupling_map=coupling_map, qubits=qubits, seed=rng)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(synthesize, seeds))
+        self.assertEqual(results, expected)
+
+    def test_token_swapper_identity(self):
+        """Test that the token swapper synthesizes the identity permutation into an
+        empty circuit, even over a disconnected coupling map."""
+        perm = PermutationGate([0, 1, 2, 3])
+        coupling_map = CouplingMap([[0, 1], [2, 3]])
+        plugin = HighLevelSynthesisPluginManager().method("permutation", "token_swapper")
+
+        qc = plugin.run(perm, coupling_map=coupling_map, qubits=[0, 1, 2, 3])
+        self.assertEqual(qc, QuantumCircuit(4))
+
+    def test_token_swapper_registers(self):
+        """Test that the token swapper returns circuits over the same register whether or
+        not the permutation is the identity."""
+        coupling_map = CouplingMap.from_line(4)
+        plugin = HighLevelSynthesisPluginManager().method("permutation", "token_swapper")
+
+        for pattern in ([0, 1, 2, 3], [3, 2, 1, 0]):
+            with self.subTest(pattern=pattern):
+                perm = PermutationGate(pattern)
+                qc = plugin.run(perm, coupling_map=coupling_map, qubits=[0, 1, 2, 3])
+                self.assertEqual(qc.qregs, [QuantumRegister(4, "q")])
+                self.assertEqual(qc.qubits, list(qc.qregs[0]))
+                self.assertEqual(Operator(qc), Operator(perm))
+
+
 class TestHighLevelSynthesisModifiers(QiskitTestCase):
     """Tests for high-level-synthesis pass."""
 
@@ -419,6 +419,56 @@ class TestOptimizeSwapBeforeMeasure(QiskitTestCase):
         new_def_ops = dict(qc_optimized[0].operation.definition.count_ops())
         self.assertEqual(new_def_ops, {"annotated": 1, "cx": 2})
 
+    def test_conjugate_reduction_ctrl_state(self):
+        """Test conjugate reduction optimization does not collect self-inverse gates
+        with different control states.
+        """
+
+        # Create a control-annotated operation.
+        # Only the outer pair of CX gates are inverse of each other.
+        qc_def = QuantumCircuit(3)
+        qc_def.cx(0, 1)  # P
+        qc_def.cx(1, 2, ctrl_state=0)  # Q
+        qc_def.h(2)  # Q
+        qc_def.cx(1, 2)  # Q
+        qc_def.cx(0, 1)  # R
+        custom = qc_def.to_gate().control(annotated=True)
+
+        # Create a quantum circuit with an annotated operation.
+        qc = QuantumCircuit(4)
+        qc.append(custom, [0, 1, 2, 3])
+
+        # Run optimization pass
+        qc_optimized = OptimizeAnnotated(basis_gates=["cx", "u"])(qc)
+
+        # Check that the optimization is correct
+        self.assertEqual(Operator(qc), Operator(qc_optimized))
+
+        # Check that the optimization finds correct pairs of inverse gates
+        new_def_ops = dict(qc_optimized[0].operation.definition.count_ops())
+        self.assertEqual(new_def_ops, {"annotated": 1, "cx": 2})
+
+    def test_conjugate_reduction_shared_base_op(self):
+        """Test conjugate reduction optimization of several annotated operations that share
+        the same base operation.
+        """
+        qc_def = QuantumCircuit(3)
+        qc_def.cx(0, 1)  # P
+        qc_def.h(2)  # Q
+        qc_def.cx(0, 1)  # R
+        base_gate = qc_def.to_gate()
+
+        qc = QuantumCircuit(5)
+        qc.append(AnnotatedOperation(base_gate, ControlModifier(1)), [0, 1, 2, 3])
+        qc.append(AnnotatedOperation(base_gate, InverseModifier()), [2, 3, 4])
+        qc.append(AnnotatedOperation(base_gate, ControlModifier(2)), [4, 0, 1, 2, 3])
+
+        qc_optimized = OptimizeAnnotated(basis_gates=["cx", "u"])(qc)
+        self.assertEqual(Operator(qc), Operator(qc_optimized))
+        for instruction in qc_optimized:
+            new_def_ops = dict(instruction.operation.definition.count_ops())
+            self.assertEqual(new_def_ops, {"annotated": 1, "cx": 2})
+
     def test_standalone_var(self):
         """Test that standalone vars work."""
         a = expr.Var.new("a", types.Bool())